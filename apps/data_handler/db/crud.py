@@ -6,7 +6,8 @@
 
 import logging
 import uuid
-from typing import List, Optional, Type, TypeVar
+from itertools import islice
+from typing import Dict, List, Optional, Type, TypeVar
 
 from data_handler.db.database import SQLALCHEMY_DATABASE_URL
 from data_handler.db.models import (
@@ -53,12 +54,25 @@ class DBConnector:
     - remove_object: Removes an object by its ID from the database.
     """
 
+    CONNECT_ARGS: dict = {}
+
     def __init__(self, db_url: str = SQLALCHEMY_DATABASE_URL):
         """
         Initialize the database connection and session factory.
         :param db_url: str = None
         """
-        self.engine = create_engine(db_url)
+        # INSERTs are already batched by insertmanyvalues, this sends executemany
+        # UPDATEs and DELETEs through psycopg2's execute_batch in pages of 500
+        self.engine = create_engine(
+            db_url,
+            connect_args=self.CONNECT_ARGS,
+            executemany_mode="values_plus_batch",
+            executemany_batch_page_size=500,
+        )
+        logger.debug(
+            "Batched INSERT ... RETURNING enabled: %s",
+            self.engine.dialect.insert_executemany_returning,
+        )
         Base.metadata.create_all(self.engine)
         self.session_factory = sessionmaker(bind=self.engine)
         self.Session = scoped_session(self.session_factory)
@@ -601,10 +615,15 @@ class ZkLendEventDBConnector(DBConnector):
     Methods:
     - create_accumulator_event: Creates an AccumulatorsSyncEventModel record.
     - create_liquidation_event: Creates a LiquidationEventModel record.
+    - write_events: Inserts batches of event records of several models at once.
     - get_all_events: Retrieves events based on filtering criteria such as protocol_id,
     event_name, or block_number.
     """
 
+    # Events can be re-fetched from the API, so commits don't wait for the WAL flush
+    CONNECT_ARGS: dict = {"options": "-c synchronous_commit=off"}
+    BATCH_SIZE: int = 1000
+
     def create_accumulator_event(
         self, protocol_id: str, event_name: str, block_number: int, event_data: dict
     ) -> None:
@@ -815,6 +834,30 @@ class ZkLendEventDBConnector(DBConnector):
         finally:
             db.close()
 
+    def write_events(self, events: Dict[Type[Base], List[dict]]) -> None:
+        """
+        Inserts batches of event records for several models in a single transaction,
+        without building ORM instances. Rows are sent in chunks of BATCH_SIZE and
+        committed once for the whole page.
+        :param events: A mapping of event model classes to the column values of
+        their events.
+        """
+        db = self.Session()
+        try:
+            for model, mappings in events.items():
+                rows = iter(mappings)
+                # SQLAlchemy caches the compiled form by the statement's structure
+                stmt = insert(model)
+                while chunk := list(islice(rows, self.BATCH_SIZE)):
+                    db.execute(stmt, chunk)
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error(f"Error writing events: {e}")
+            raise e
+        finally:
+            db.close()
+
     def get_all_events(
         self,
         protocol_id: Optional[str] = None,
@@ -1,7 +1,5 @@
 """ Base classes for ORM models. """
-from uuid import uuid4
-
-from sqlalchemy import UUID, BigInteger, Column, MetaData, String
+from sqlalchemy import UUID, BigInteger, Column, String, text
 from sqlalchemy.orm import DeclarativeBase, Mapped
 from sqlalchemy.types import JSON
 from sqlalchemy_utils.types.choice import ChoiceType
@@ -13,11 +11,12 @@ class Base(DeclarativeBase):
     """
     Base class for ORM models.
 
-    :ivar id: The unique identifier of the entity.
+    :ivar id: The unique identifier of the entity, generated by the database.
     """
 
-    id: Mapped[UUID] = Column(UUID, default=uuid4, primary_key=True)
-    metadata = MetaData()
+    id: Mapped[UUID] = Column(
+        UUID(as_uuid=True), server_default=text("gen_random_uuid()"), primary_key=True
+    )
 
 
 class BaseState(Base):
@@ -1,7 +1,7 @@
 """ This module contains the OrderBookModel class representing 
 an order book entry in the database. """
-from sqlalchemy import DECIMAL, BigInteger, Column, String
-from sqlalchemy.types import JSON
+from sqlalchemy import DECIMAL, BigInteger, Column, String, text
+from sqlalchemy.dialects.postgresql import JSONB
 
 from data_handler.db.models.base import Base
 
@@ -15,9 +15,13 @@ class OrderBookModel(Base):
 
     token_a = Column(String, nullable=False, index=True)
     token_b = Column(String, nullable=False, index=True)
-    timestamp = Column(BigInteger, nullable=False)
+    timestamp = Column(
+        BigInteger,
+        nullable=False,
+        server_default=text("extract(epoch from now())::bigint"),
+    )
     block = Column(BigInteger, nullable=False)
     dex = Column(String, nullable=False, index=True)
     current_price = Column(DECIMAL, nullable=True)
-    asks = Column(JSON, nullable=True)
-    bids = Column(JSON, nullable=True)
+    asks = Column(JSONB, nullable=True)
+    bids = Column(JSONB, nullable=True)
@@ -1,6 +1,9 @@
 """ Module for making HTTP GET requests to the DeRisk API using the `requests` library. """
 import os
+from itertools import chain
+from typing import Iterator
 
+import ijson
 import requests
 from dotenv import load_dotenv
 
@@ -69,3 +72,42 @@ class DeRiskAPIConnector:
             return response.json()
         except requests.RequestException as e:
             return {"error": str(e)}
+
+    def stream_data(
+        self, from_address: str, min_block_number: int, max_block_number: int
+    ) -> Iterator[dict]:
+        """
+        Streams events from the DeRisk API for a given address and block number range.
+        The response body is decoded incrementally, so only one event is held in memory
+        at a time instead of the whole response.
+
+        :param from_address: The address of the contract or account on StarkNet.
+        :type from_address: str
+        :param min_block_number: The minimum block number from which to retrieve events.
+        :type min_block_number: int
+        :param max_block_number: The maximum block number to which to retrieve events.
+        :type max_block_number: int
+        :return: An iterator over the events in the API response.
+        :rtype: Iterator[dict]
+        :raise requests.RequestException: If the request fails.
+        :raise ijson.JSONError: If the response is not valid JSON.
+        :raise ValueError: If the API responds with an error instead of a list of events.
+        """
+        self._validate_data(from_address, min_block_number, max_block_number)
+        params = {
+            "from_address": from_address,
+            "min_block_number": min_block_number,
+            "max_block_number": max_block_number,
+        }
+        with requests.get(self.api_url, params=params, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            # Peek at the first token, the API reports errors as an object, not a list
+            parse_events = ijson.parse(response.raw)
+            first_event = next(parse_events)
+            parse_events = chain([first_event], parse_events)
+            if first_event[1] != "start_array":
+                body = next(ijson.items(parse_events, ""))
+                error = body.get("error", body) if isinstance(body, dict) else body
+                raise ValueError(f"Error fetching events: {error}")
+            yield from ijson.items(parse_events, "item")
@@ -9,13 +9,13 @@ class AccumulatorsSyncEventData(BaseModel):
 
     Attributes:
         token: The token address involved in the sync.
-        lending_accumulator: The lending accumulator value as a string.
-        debt_accumulator: The debt accumulator value as a string.
+        lending_accumulator: The lending accumulator value as a Decimal.
+        debt_accumulator: The debt accumulator value as a Decimal.
     """
 
     token: str
-    lending_accumulator: str
-    debt_accumulator: str
+    lending_accumulator: Decimal
+    debt_accumulator: Decimal
 
     @field_validator("token")
     def validate_address(cls, value: str, info: ValidationInfo) -> str:
@@ -32,6 +32,9 @@ class AccumulatorsSyncEventData(BaseModel):
         Returns:
             str: Formatted address with leading zeros.
         """
+        if not value.startswith("0x"):
+            raise ValueError(f"Invalid address provided for {info.field_name}")
+        return add_leading_zeros(value)
 
 
 class LiquidationEventData(BaseModel):
@@ -42,19 +45,19 @@ class LiquidationEventData(BaseModel):
         liquidator: The address of the liquidator.
         user: The address of the user being liquidated.
         debt_token: The address of the debt token.
-        debt_raw_amount: The raw amount of debt as a string.
-        debt_face_amount: The face amount of debt as a string.
+        debt_raw_amount: The raw amount of debt as a Decimal.
+        debt_face_amount: The face amount of debt as a Decimal.
         collateral_token: The address of the collateral token.
-        collateral_amount: The amount of collateral as a string.
+        collateral_amount: The amount of collateral as a Decimal.
     """
 
     liquidator: str
     user: str
     debt_token: str
-    debt_raw_amount: str
-    debt_face_amount: str
+    debt_raw_amount: Decimal
+    debt_face_amount: Decimal
     collateral_token: str
-    collateral_amount: str
+    collateral_amount: Decimal
 
     @field_validator("liquidator", "user", "debt_token", "collateral_token")
     def validate_address(cls, value: str, info: ValidationInfo) -> str:
@@ -71,6 +74,9 @@ class LiquidationEventData(BaseModel):
         Returns:
             str: Formatted address with leading zeros.
         """
+        if not value.startswith("0x"):
+            raise ValueError(f"Invalid address provided for {info.field_name}")
+        return add_leading_zeros(value)
 
 
 class WithdrawalEventData(BaseModel):
@@ -80,12 +86,12 @@ class WithdrawalEventData(BaseModel):
     Attributes:
         user: The user address making the withdrawal.
         token: The token address being withdrawn.
-        amount: The amount being withdrawn as a string.
+        amount: The amount being withdrawn as a Decimal.
     """
 
     user: str
     token: str
-    amount: str
+    amount: Decimal
 
     @field_validator("user", "token")
     def validate_address(cls, value: str, info: ValidationInfo) -> str:
@@ -102,6 +108,9 @@ class WithdrawalEventData(BaseModel):
         Returns:
             str: Formatted address with leading zeros.
         """
+        if not value.startswith("0x"):
+            raise ValueError(f"Invalid address provided for {info.field_name}")
+        return add_leading_zeros(value)
 
 
 class BorrowingEventData(BaseModel):
@@ -111,14 +120,14 @@ class BorrowingEventData(BaseModel):
     Attributes:
         user: The user address making the borrowing.
         token: The token address being borrowed.
-        raw_amount: The raw amount being borrowed as a string.
-        face_amount: The face amount being borrowed as a string.
+        raw_amount: The raw amount being borrowed as a Decimal.
+        face_amount: The face amount being borrowed as a Decimal.
     """
 
     user: str
     token: str
-    raw_amount: str
-    face_amount: str
+    raw_amount: Decimal
+    face_amount: Decimal
 
     @field_validator("user", "token")
     def validate_address(cls, value: str, info: ValidationInfo) -> str:
@@ -148,15 +157,15 @@ class RepaymentEventData(BaseModel):
         repayer: The address of the repayer.
         beneficiary: The address of the beneficiary.
         token: The token address being repaid.
-        raw_amount: The raw amount being repaid as a string.
-        face_amount: The face amount being repaid as a string.
+        raw_amount: The raw amount being repaid as a Decimal.
+        face_amount: The face amount being repaid as a Decimal.
     """
 
     repayer: str
     beneficiary: str
     token: str
-    raw_amount: str
-    face_amount: str
+    raw_amount: Decimal
+    face_amount: Decimal
 
 
 class DepositEventData(BaseModel):
@@ -166,12 +175,12 @@ class DepositEventData(BaseModel):
     Attributes:
         user: The user address making the deposit.
         token: The token address being deposited.
-        face_amount: The face amount being deposited as a string.
+        face_amount: The face amount being deposited as a Decimal.
     """
 
     user: str
     token: str
-    face_amount: str
+    face_amount: Decimal
 
 
 class CollateralEnabledDisabledEventData(BaseModel):
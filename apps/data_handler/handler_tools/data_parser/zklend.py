@@ -2,7 +2,9 @@
 This module contains the logic to parse the zkLend data to human-readable format.
 """
 
+from decimal import Decimal
 from typing import Any, List
+from shared.helpers import add_leading_zeros
 from data_handler.handler_tools.data_parser.serializers import (
     AccumulatorsSyncEventData,
     LiquidationEventData,
@@ -13,10 +15,31 @@ from data_handler.handler_tools.data_parser.serializers import (
     CollateralEnabledDisabledEventData,
 )
 
+# zkLend accumulators are fixed-point felts scaled by 10**27
+ACCUMULATOR_DECIMALS = 27
+
+
+def _hex_to_amount(value: str) -> Decimal:
+    """
+    Converts a hex-encoded zkLend amount to its Decimal value.
+    """
+    return Decimal(int(value, 16))
+
+
+def _hex_to_accumulator(value: str) -> Decimal:
+    """
+    Converts a hex-encoded zkLend accumulator to its Decimal value.
+    """
+    return _hex_to_amount(value).scaleb(-ACCUMULATOR_DECIMALS)
+
 
 class ZklendDataParser:
     """
     Parses the zkLend data to human-readable format.
+
+    Hex amounts are converted to Decimal here. Serializers without field
+    validators are then built with `model_construct`, since validating the
+    converted values again would only add overhead on the ingestion path.
     """
 
     @classmethod
@@ -31,14 +54,57 @@ class ZklendDataParser:
                 token, lending accumulator, and debt accumulator.
 
         Returns:
-            AccumulatorsSyncEventData: A model with the parsed event data.
+            AccumulatorsSyncEventData: A model with the parsed event data, with both
+                accumulators converted like in `parse_accumulators_sync_batch`.
         """
         return AccumulatorsSyncEventData(
             token=event_data[0],
-            lending_accumulator=event_data[1],
-            debt_accumulator=event_data[2],
+            lending_accumulator=_hex_to_accumulator(event_data[1]),
+            debt_accumulator=_hex_to_accumulator(event_data[2]),
         )
 
+    @classmethod
+    def parse_accumulators_sync_batch(
+        cls, events_data: list[list[Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        Parses a batch of AccumulatorsSync event data column by column.
+
+        The batch is transposed into token and accumulator columns, each column is
+        converted in a single `map` pass and the columns are zipped back into rows.
+        The accumulators are 10**27-scaled felts that overflow NumPy's fixed-width
+        integers, so they are converted with Python ints.
+
+        Args:
+            events_data (list[list[Any]]): A list of raw event data lists, each with
+                token, lending accumulator, and debt accumulator.
+
+        Raises:
+            ValueError: If any token address is invalid.
+
+        Returns:
+            list[dict[str, Any]]: A dictionary per event with the token address padded
+                with leading zeros and both accumulators as Decimal.
+        """
+        if not events_data:
+            return []
+        tokens, lending_accumulators, debt_accumulators = list(zip(*events_data))[:3]
+        # Same check as AccumulatorsSyncEventData.validate_address
+        if not all(token.startswith("0x") for token in tokens):
+            raise ValueError("Invalid address provided for token")
+        return [
+            {
+                "token": token,
+                "lending_accumulator": lending_accumulator,
+                "debt_accumulator": debt_accumulator,
+            }
+            for token, lending_accumulator, debt_accumulator in zip(
+                map(add_leading_zeros, tokens),
+                map(_hex_to_accumulator, lending_accumulators),
+                map(_hex_to_accumulator, debt_accumulators),
+            )
+        ]
+
     @classmethod
     def parse_deposit_event(cls, event_data: List[Any]) -> DepositEventData:
         """
@@ -46,10 +112,10 @@ class ZklendDataParser:
         :param event_data: list of length 4 of the event data
         :return: DepositEventData
         """
-        return DepositEventData(
+        return DepositEventData.model_construct(
             user=event_data[0],
             token=event_data[1],
-            face_amount=event_data[2],
+            face_amount=_hex_to_amount(event_data[2]),
         )
 
     @classmethod
@@ -72,7 +138,7 @@ class ZklendDataParser:
         """
         return WithdrawalEventData(
             user=event_data[0],
-            amount=event_data[1],
+            amount=_hex_to_amount(event_data[1]),
             token=event_data[2],
         )
 
@@ -90,8 +156,8 @@ class ZklendDataParser:
         return BorrowingEventData(
             user=event_data[0],
             token=event_data[1],
-            raw_amount=event_data[2],
-            face_amount=event_data[3],
+            raw_amount=_hex_to_amount(event_data[2]),
+            face_amount=_hex_to_amount(event_data[3]),
         )
 
     @classmethod
@@ -105,12 +171,12 @@ class ZklendDataParser:
         Returns:
             RepaymentEventData: A model with the parsed event data.
         """
-        return RepaymentEventData(
+        return RepaymentEventData.model_construct(
             repayer=event_data[0],
             beneficiary=event_data[1],
             token=event_data[2],
-            raw_amount=event_data[3],
-            face_amount=event_data[4],
+            raw_amount=_hex_to_amount(event_data[3]),
+            face_amount=_hex_to_amount(event_data[4]),
         )
 
     @classmethod
@@ -128,10 +194,10 @@ class ZklendDataParser:
             liquidator=event_data[0],
             user=event_data[1],
             debt_token=event_data[2],
-            debt_raw_amount=event_data[3],
-            debt_face_amount=event_data[4],
+            debt_raw_amount=_hex_to_amount(event_data[3]),
+            debt_face_amount=_hex_to_amount(event_data[4]),
             collateral_token=event_data[5],
-            collateral_amount=event_data[6],
+            collateral_amount=_hex_to_amount(event_data[6]),
         )
 
     @classmethod
@@ -148,7 +214,7 @@ class ZklendDataParser:
         Returns:
             CollateralEnabledDisabledEventData: A model with the parsed event data.
         """
-        return CollateralEnabledDisabledEventData(
+        return CollateralEnabledDisabledEventData.model_construct(
             user=event_data[0],
             token=event_data[1],
         )
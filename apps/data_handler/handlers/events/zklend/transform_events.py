@@ -3,93 +3,118 @@ This module contains the ZklendTransformer class,
 which is used to transform Zklend events.
 """
 import logging
-from pydantic import BaseModel
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+
+import ijson
+import requests
 from data_handler.db.models.base import Base
+from data_handler.db.models.zklend_events import (
+    AccumulatorsSyncEventModel,
+    LiquidationEventModel,
+    WithdrawalEventModel,
+    BorrowingEventModel,
+    RepaymentEventModel,
+    DepositEventModel,
+    CollateralEnabledDisabledEventModel,
+)
 from data_handler.handler_tools.api_connector import DeRiskAPIConnector
-from typing import Dict, Any, Tuple, Type, Callable
+from typing import Dict, Iterable, Iterator, List, Tuple, Type, Callable
 from shared.constants import ProtocolIDs
 from data_handler.handler_tools.data_parser.zklend import ZklendDataParser
 
-from data_handler.handler_tools.data_parser.serializers import (
-    AccumulatorsSyncEventData,
-    LiquidationEventData,
-    WithdrawalEventData,
-    BorrowingEventData,
-    RepaymentEventData,
-    DepositEventData,
-    CollateralEnabledDisabledEventData,
-)
-
 from data_handler.db.crud import ZkLendEventDBConnector
 from data_handler.handler_tools.constants import ProtocolAddresses
 
 
 logger = logging.getLogger(__name__)
 
-EVENT_MAPPING: Dict[str, Tuple[Callable, str]] = {
-    "AccumulatorsSync": (
-        ZklendDataParser.parse_accumulators_sync_event,
-        "save_accumulators_sync_event"
+
+@dataclass(frozen=True, slots=True)
+class EventBinding:
+    """
+    Binds a zkLend event type to its parser and the model it is written to.
+
+    :ivar parser: Parses the data of a single event, or of all events of the type
+        at once if `batched` is set.
+    :ivar model: The model the parsed events are written to.
+    :ivar batched: Whether the parser takes a list of event data and returns a list
+        of column dictionaries.
+    """
+
+    parser: Callable
+    model: Type[Base]
+    batched: bool = False
+
+
+EVENT_MAPPING: Dict[str, EventBinding] = {
+    "AccumulatorsSync": EventBinding(
+        parser=ZklendDataParser.parse_accumulators_sync_batch,
+        model=AccumulatorsSyncEventModel,
+        batched=True,
     ),
-    "zklend::market::Market::AccumulatorsSync": (
-        ZklendDataParser.parse_accumulators_sync_event,
-        "save_accumulators_sync_event"
+    "zklend::market::Market::AccumulatorsSync": EventBinding(
+        parser=ZklendDataParser.parse_accumulators_sync_batch,
+        model=AccumulatorsSyncEventModel,
+        batched=True,
     ),
-    "Liquidation": (
-        ZklendDataParser.parse_liquidation_event,
-        "save_liquidation_event"
+    "Liquidation": EventBinding(
+        parser=ZklendDataParser.parse_liquidation_event,
+        model=LiquidationEventModel,
     ),
-    "zklend::market::Market::Liquidation": (
-        ZklendDataParser.parse_liquidation_event,
-        "save_liquidation_event"
+    "zklend::market::Market::Liquidation": EventBinding(
+        parser=ZklendDataParser.parse_liquidation_event,
+        model=LiquidationEventModel,
     ),
-    "Repayment": (
-        ZklendDataParser.parse_repayment_event,
-        "save_repayment_event"
+    "Repayment": EventBinding(
+        parser=ZklendDataParser.parse_repayment_event,
+        model=RepaymentEventModel,
     ),
-    "zklend::market::Market::Repayment": (
-        ZklendDataParser.parse_repayment_event,
-        "save_repayment_event"
+    "zklend::market::Market::Repayment": EventBinding(
+        parser=ZklendDataParser.parse_repayment_event,
+        model=RepaymentEventModel,
     ),
-    "Borrowing": (
-        ZklendDataParser.parse_borrowing_event,
-        "save_borrowing_event"
+    "Borrowing": EventBinding(
+        parser=ZklendDataParser.parse_borrowing_event,
+        model=BorrowingEventModel,
     ),
-    "zklend::market::Market::Borrowing": (
-        ZklendDataParser.parse_borrowing_event,
-        "save_borrowing_event"
+    "zklend::market::Market::Borrowing": EventBinding(
+        parser=ZklendDataParser.parse_borrowing_event,
+        model=BorrowingEventModel,
     ),
-    "Deposit": (
-        ZklendDataParser.parse_deposit_event,
-        "save_deposit_event"
+    "Deposit": EventBinding(
+        parser=ZklendDataParser.parse_deposit_event,
+        model=DepositEventModel,
     ),
-    "zklend::market::Market::Deposit": (
-        ZklendDataParser.parse_deposit_event,
-        "save_deposit_event"
+    "zklend::market::Market::Deposit": EventBinding(
+        parser=ZklendDataParser.parse_deposit_event,
+        model=DepositEventModel,
     ),
-    "Withdrawal": (
-        ZklendDataParser.parse_withdrawal_event,
-        "save_withdrawal_event"
+    "Withdrawal": EventBinding(
+        parser=ZklendDataParser.parse_withdrawal_event,
+        model=WithdrawalEventModel,
     ),
-    "zklend::market::Market::Withdrawal": (
-        ZklendDataParser.parse_withdrawal_event,
-        "save_withdrawal_event"
+    "zklend::market::Market::Withdrawal": EventBinding(
+        parser=ZklendDataParser.parse_withdrawal_event,
+        model=WithdrawalEventModel,
     ),
-    "CollateralEnabled": (
-        ZklendDataParser.parse_collateral_enabled_disabled_event,
-        "save_collateral_enabled_disabled_event"
+    "CollateralEnabled": EventBinding(
+        parser=ZklendDataParser.parse_collateral_enabled_disabled_event,
+        model=CollateralEnabledDisabledEventModel,
     ),
-    "zklend::market::Market::CollateralEnabled": (
-        ZklendDataParser.parse_collateral_enabled_disabled_event,
-        "save_collateral_enabled_disabled_event"
+    "zklend::market::Market::CollateralEnabled": EventBinding(
+        parser=ZklendDataParser.parse_collateral_enabled_disabled_event,
+        model=CollateralEnabledDisabledEventModel,
     ),
-    "CollateralDisabled": (
-        ZklendDataParser.parse_collateral_enabled_disabled_event,
-        "save_collateral_enabled_disabled_event"
+    "CollateralDisabled": EventBinding(
+        parser=ZklendDataParser.parse_collateral_enabled_disabled_event,
+        model=CollateralEnabledDisabledEventModel,
     ),
-    "zklend::market::Market::CollateralDisabled": (
-        ZklendDataParser.parse_collateral_enabled_disabled_event,
-        "save_collateral_enabled_disabled_event"
+    "zklend::market::Market::CollateralDisabled": EventBinding(
+        parser=ZklendDataParser.parse_collateral_enabled_disabled_event,
+        model=CollateralEnabledDisabledEventModel,
     ),
 }
 
@@ -99,10 +124,13 @@ class ZklendTransformer:
     A class that is used to transform Zklend events into database models.
     """
 
-    EVENT_MAPPING: Dict[str, Tuple[Callable, str, Type[Base]]] = EVENT_MAPPING
+    EVENT_MAPPING: Dict[str, EventBinding] = EVENT_MAPPING
     PROTOCOL_ADDRESSES: str = ProtocolAddresses.ZKLEND_MARKET_ADDRESSES
     PROTOCOL_TYPE: ProtocolIDs = ProtocolIDs.ZKLEND
     PAGINATION_SIZE: int = 1000
+    CHUNK_BLOCKS: int = 1000
+    MAX_FETCH_WORKERS: int = 8
+    WRITE_BATCH_SIZE: int = 1000
 
     def __init__(self):
         """
@@ -113,164 +141,152 @@ class ZklendTransformer:
         self.db_connector = ZkLendEventDBConnector()
         self.last_block = self.db_connector.get_last_block(self.PROTOCOL_TYPE)
     
-    def fetch_and_transform_events(self, from_address: str, min_block: int, max_block: int) -> None:
+    def fetch_events(self, from_address: str, min_block: int, max_block: int) -> List[dict]:
         """
-        Fetch events from the DeRisk API and transform them into database models.
+        Fetch events from the DeRisk API for the given block range.
+        Ranges wider than CHUNK_BLOCKS are split into sub-ranges that are fetched
+        concurrently, which bounds the size of each response. The API bounds are
+        inclusive, so the sub-ranges don't share their boundary blocks.
+        :raise ValueError: If the API returns an error.
         """
-        # Fetch events using the API connector
-        response = self.api_connector.get_data(
-            from_address=from_address,
-            min_block_number=min_block,
-            max_block_number=max_block
-        )
+        block_ranges = [
+            (start, min(start + self.CHUNK_BLOCKS - 1, max_block))
+            for start in range(min_block, max_block + 1, self.CHUNK_BLOCKS)
+        ]
 
-        if "error" in response:
-            raise ValueError(f"Error fetching events: {response['error']}")
+        def get_data(block_range: Tuple[int, int]) -> List[dict] | dict:
+            return self.api_connector.get_data(
+                from_address=from_address,
+                min_block_number=block_range[0],
+                max_block_number=block_range[1]
+            )
 
-        # Process each event based on its type
-        for event in response:
-            event_type = event.get("key_name")
-            if event_type in self.EVENT_MAPPING:
-                parser_func, save_to_db_method_name = self.EVENT_MAPPING[event_type]
-                parsed_data = parser_func(event["data"])
+        if len(block_ranges) == 1:
+            responses = [get_data(block_ranges[0])]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.MAX_FETCH_WORKERS, len(block_ranges))
+            ) as executor:
+                responses = list(executor.map(get_data, block_ranges))
 
-                getattr(self, save_to_db_method_name)(
-                    event_name=event_type,
-                    block_number=event.get("block_number"),
-                    event_data=parsed_data
-                )
-            else:
-                logger.info(f"Event type {event_type} not supported, yet...")
+        events = []
+        for response in responses:
+            if "error" in response:
+                raise ValueError(f"Error fetching events: {response['error']}")
+            events.extend(response)
+        return events
 
-    def save_accumulators_sync_event(self, event_name: str, block_number: int, event_data: AccumulatorsSyncEventData) -> None:
+    def stream_events(self, from_address: str, min_block: int, max_block: int) -> Iterator[dict]:
         """
-        Save an accumulators sync event to the database.
+        Stream events from the DeRisk API for the given block range, decoding
+        the response incrementally instead of loading it into memory at once.
+        :raise ValueError: If the API request fails or returns an error.
         """
-        self.db_connector.create_accumulator_event(
-            protocol_id=self.PROTOCOL_TYPE,
-            event_name=event_name,
-            block_number=block_number,
-            event_data={
-                "token": event_data.token,
-                "lending_accumulator": event_data.lending_accumulator,
-                "debt_accumulator": event_data.debt_accumulator
-            }
-        )
+        try:
+            yield from self.api_connector.stream_data(
+                from_address=from_address,
+                min_block_number=min_block,
+                max_block_number=max_block
+            )
+        except (requests.RequestException, ijson.JSONError) as e:
+            raise ValueError(f"Error fetching events: {e}") from e
 
-    def save_liquidation_event(self, event_name: str, block_number: int, event_data: LiquidationEventData) -> None:
+    def fetch_and_transform_events(self, from_address: str, min_block: int, max_block: int) -> None:
         """
-        Save a liquidation event to the database.
+        Fetch events from the DeRisk API and transform them into database models.
+        A range that fits in one chunk is streamed and written every WRITE_BATCH_SIZE
+        events, wider ranges are fetched in parallel chunks and written at once.
+        Both block bounds are inclusive.
         """
-        self.db_connector.create_liquidation_event(
-            protocol_id=self.PROTOCOL_TYPE,
-            event_name=event_name,
-            block_number=block_number,
-            event_data={
-                "liquidator": event_data.liquidator,
-                "user": event_data.user,
-                "debt_token": event_data.debt_token,
-                "debt_raw_amount": event_data.debt_raw_amount,
-                "debt_face_amount": event_data.debt_face_amount,
-                "collateral_token": event_data.collateral_token,
-                "collateral_amount": event_data.collateral_amount
-            }
-        )
+        if max_block - min_block < self.CHUNK_BLOCKS:
+            events = self.stream_events(from_address, min_block, max_block)
+            while batch := list(islice(events, self.WRITE_BATCH_SIZE)):
+                self.transform_events(batch)
+        else:
+            self.transform_events(self.fetch_events(from_address, min_block, max_block))
 
-    def save_borrowing_event(self, event_name: str, block_number: int, event_data: BorrowingEventData) -> None:
+    def transform_events(self, events: Iterable[dict]) -> None:
         """
-        Save a borrowing event to the database.
+        Parse the fetched events and write them to the database in a single transaction.
         """
-        self.db_connector.create_borrowing_event(
-            protocol_id=self.PROTOCOL_TYPE,
-            event_name=event_name,
-            block_number=block_number,
-            event_data={
-                "user": event_data.user,
-                "token": event_data.token,
-                "raw_amount": event_data.raw_amount,
-                "face_amount": event_data.face_amount
-            }
-        )
+        events_by_model = self.parse_events(events)
+        if events_by_model:
+            self.db_connector.write_events(events_by_model)
 
-    def save_deposit_event(self, event_name: str, block_number: int, event_data: DepositEventData) -> None:
-        """
-        Save a deposit event to the database.
-        """
-        self.db_connector.create_deposit_event(
-            protocol_id=self.PROTOCOL_TYPE,
-            event_name=event_name,
-            block_number=block_number,
-            event_data={
-                "user": event_data.user,
-                "token": event_data.token,
-                "face_amount": event_data.face_amount
-            }
-        )
-    
-    def save_withdrawal_event(self, event_name: str, block_number: int, event_data: WithdrawalEventData) -> None:
-        """
-        Save a withdrawal event to the database.
-        """
-        self.db_connector.create_withdrawal_event(
-            protocol_id=self.PROTOCOL_TYPE,
-            event_name=event_name,
-            block_number=block_number,
-            event_data={
-                "user": event_data.user,
-                "token": event_data.token,
-                "amount": event_data.amount
-            }
-        )
-    
-    def save_collateral_enabled_disabled_event(self, event_name: str, block_number: int, event_data: CollateralEnabledDisabledEventData) -> None:
-        """
-        Save a collateral enabled/disabled event to the database.
-        """
-        self.db_connector.create_collateral_enabled_disabled_event(
-            protocol_id=self.PROTOCOL_TYPE,
-            event_name=event_name,
-            block_number=block_number,
-            event_data={
-                "user": event_data.user,
-                "token": event_data.token
-            }
-        )
-    
-    def save_repayment_event(self, event_name: str, block_number: int, event_data: RepaymentEventData) -> None:
+    def parse_events(self, events: Iterable[dict]) -> Dict[Type[Base], List[dict]]:
         """
-        Save a repayment event to the database.
+        Parse the events into rows grouped by the model they are written to.
         """
-        self.db_connector.create_repayment_event(
-            protocol_id=self.PROTOCOL_TYPE,
-            event_name=event_name,
-            block_number=block_number,
-            event_data={
-                "repayer": event_data.repayer,
-                "beneficiary": event_data.beneficiary,
-                "token": event_data.token,
-                "raw_amount": event_data.raw_amount,
-                "face_amount": event_data.face_amount
-            }
-        )
+        # Bucket only the block number and data of each event by type, so the
+        # dispatch happens once per type and the rest of the event is dropped
+        events_by_type: Dict[str, List[Tuple[int, list]]] = defaultdict(list)
+        for event in events:
+            events_by_type[event.get("key_name")].append(
+                (event.get("block_number"), event["data"])
+            )
+
+        # Group the parsed events by model, so each type is written in one batch
+        events_by_model: Dict[Type[Base], List[dict]] = defaultdict(list)
+        protocol_id = self.PROTOCOL_TYPE
+        for event_type, events_of_type in events_by_type.items():
+            binding = self.EVENT_MAPPING.get(event_type)
+            if binding is None:
+                logger.info(f"Event type {event_type} not supported, yet...")
+                continue
+
+            if binding.batched:
+                parsed_events = binding.parser([data for _, data in events_of_type])
+            else:
+                # Serializer field names match the model columns, so the parsed
+                # fields are merged straight into the row without a model_dump() copy
+                parser = binding.parser
+                parsed_events = (vars(parser(data)) for _, data in events_of_type)
+            events_by_model[binding.model].extend(
+                {
+                    "protocol_id": protocol_id,
+                    "event_name": event_type,
+                    "block_number": block_number,
+                    **parsed_data,
+                }
+                for (block_number, _), parsed_data in zip(events_of_type, parsed_events)
+            )
+        return events_by_model
 
     def run(self) -> None:
         """
         Run the ZklendTransformer class.
+        Each page of events is streamed and parsed while the previous one is being
+        written to the database in the background, and every page is committed
+        in a single transaction.
         """
         max_retries = 5
         retry = 0
-        while retry < max_retries:
-            self.fetch_and_transform_events(
-                from_address=self.PROTOCOL_ADDRESSES,
-                min_block=self.last_block,
-                max_block=self.last_block + self.PAGINATION_SIZE
-            )
-            self.last_block += self.PAGINATION_SIZE
-            retry += 1
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            pending_write = None
+            while retry < max_retries:
+                # The API bounds are inclusive, so a page ends right before the next one
+                events_by_model = self.parse_events(
+                    self.stream_events(
+                        self.PROTOCOL_ADDRESSES,
+                        self.last_block,
+                        self.last_block + self.PAGINATION_SIZE - 1,
+                    )
+                )
+                retry += 1
+                # Wait for the previous page, so its errors surface and pages land in order
+                if pending_write is not None:
+                    pending_write.result()
+                    pending_write = None
+                if events_by_model:
+                    pending_write = writer.submit(
+                        self.db_connector.write_events, events_by_model
+                    )
+                self.last_block += self.PAGINATION_SIZE
+            if pending_write is not None:
+                pending_write.result()
         if retry == max_retries:
             logger.info(f"Reached max retries for address {self.PROTOCOL_ADDRESSES}")
 
-
 if __name__ == "__main__":
     """
     This is the init function for when ZklendTransformer class is called directly.
@@ -0,0 +1,71 @@
+"""orderbook jsonb and timestamp default
+
+Revision ID: 5e8a2d7c4b19
+Revises: c53651eb145e
+Create Date: 2026-10-15 11:36:52.184305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8a2d7c4b19'
+down_revision: Union[str, None] = 'c53651eb145e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'orderbook',
+        'asks',
+        existing_type=sa.JSON(),
+        type_=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using='asks::jsonb',
+    )
+    op.alter_column(
+        'orderbook',
+        'bids',
+        existing_type=sa.JSON(),
+        type_=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using='bids::jsonb',
+    )
+    op.alter_column(
+        'orderbook',
+        'timestamp',
+        existing_type=sa.BigInteger(),
+        existing_nullable=False,
+        server_default=sa.text('extract(epoch from now())::bigint'),
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'orderbook',
+        'timestamp',
+        existing_type=sa.BigInteger(),
+        existing_nullable=False,
+        server_default=None,
+    )
+    op.alter_column(
+        'orderbook',
+        'bids',
+        existing_type=postgresql.JSONB(),
+        type_=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using='bids::json',
+    )
+    op.alter_column(
+        'orderbook',
+        'asks',
+        existing_type=postgresql.JSONB(),
+        type_=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using='asks::json',
+    )
@@ -0,0 +1,73 @@
+"""server side uuid primary keys
+
+Revision ID: 9b4d1f0e7a26
+Revises: 5e8a2d7c4b19
+Create Date: 2026-10-15 14:02:17.531846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b4d1f0e7a26'
+down_revision: Union[str, None] = '5e8a2d7c4b19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = (
+    'accumulators_sync_event',
+    'bearing_collateral_burn_event',
+    'borrowing_event',
+    'collateral_enabled_disabled_event',
+    'debt_burn_event',
+    'debt_mint_event',
+    'debt_transfer_event',
+    'deposit_event',
+    'hashtack_collateral_debt',
+    'health_ratio_level',
+    'interest_rate',
+    'liquidable_debt',
+    'liquidation_event',
+    'loan_state',
+    'orderbook',
+    'repayment_event',
+    'withdrawal_event',
+    'zklend_collateral_debt',
+)
+# No migration creates these, they only exist where Base.metadata.create_all has run
+RUNTIME_TABLES = (
+    'bearing_collateral_mint_event',
+    'interest_rate_event',
+)
+
+
+def _existing_tables() -> tuple:
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    return TABLES + tuple(table for table in RUNTIME_TABLES if table in existing)
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in since PostgreSQL 13, pgcrypto provides it before
+    op.execute('CREATE EXTENSION IF NOT EXISTS pgcrypto')
+    for table in _existing_tables():
+        op.alter_column(
+            table,
+            'id',
+            existing_type=sa.UUID(),
+            existing_nullable=False,
+            server_default=sa.text('gen_random_uuid()'),
+        )
+
+
+def downgrade() -> None:
+    for table in _existing_tables():
+        op.alter_column(
+            table,
+            'id',
+            existing_type=sa.UUID(),
+            existing_nullable=False,
+            server_default=None,
+        )
@@ -1,4 +1,5 @@
 """ This module contains tests for the DeRiskAPIConnector class. """
+import io
 import os
 import unittest
 from unittest.mock import MagicMock, patch
@@ -67,6 +68,48 @@ class TestDeRiskAPIConnector(unittest.TestCase):
         self.assertIn("error", result)
         self.assertEqual(result["error"], "Mocked request exception")
 
+    @patch.dict(os.environ, {"DERISK_API_URL": DERISK_API_URL})
+    @patch("requests.get")
+    def test_stream_data_yields_events(self, mock_get):
+        """Test that DeRiskAPIConnector.stream_data() yields events from the response body."""
+        mock_response = MagicMock(raw=io.BytesIO(b'[{"block_number": 1}, {"block_number": 2}]'))
+        mock_get.return_value.__enter__.return_value = mock_response
+
+        connector = DeRiskAPIConnector()
+        result = list(connector.stream_data(
+            "0x04c0a5193d58f74fbace4b74dcf65481e734ed1714121bdc571da345540efa05",
+            630000,
+            631000,
+        ))
+
+        self.assertEqual(result, [{"block_number": 1}, {"block_number": 2}])
+        mock_response.raise_for_status.assert_called_once()
+        mock_get.assert_called_once_with(
+            self.DERISK_API_URL,
+            params={
+                "from_address":
+                "0x04c0a5193d58f74fbace4b74dcf65481e734ed1714121bdc571da345540efa05",
+                "min_block_number": 630000,
+                "max_block_number": 631000,
+            },
+            stream=True,
+        )
+
+    @patch.dict(os.environ, {"DERISK_API_URL": DERISK_API_URL})
+    @patch("requests.get")
+    def test_stream_data_error_response(self, mock_get):
+        """Test that DeRiskAPIConnector.stream_data() raises on an error object."""
+        mock_response = MagicMock(raw=io.BytesIO(b'{"error": "API Error"}'))
+        mock_get.return_value.__enter__.return_value = mock_response
+
+        connector = DeRiskAPIConnector()
+        with self.assertRaisesRegex(ValueError, "Error fetching events: API Error"):
+            list(connector.stream_data(
+                "0x04c0a5193d58f74fbace4b74dcf65481e734ed1714121bdc571da345540efa05",
+                630000,
+                631000,
+            ))
+
     @patch.dict(os.environ, {"DERISK_API_URL": DERISK_API_URL})
     def test_get_data_type_errors(self):
         """Test that get_data() raises TypeError for invalid types."""
@@ -2,15 +2,26 @@
 Test the zklend transformer
 """
 
+import ijson
 import pytest
+from decimal import Decimal
 from typing import Dict, Any
 from shared.constants import ProtocolIDs
 from unittest.mock import MagicMock, patch
+from requests.exceptions import RequestException
 from data_handler.handlers.events.zklend.transform_events import ZklendTransformer
+from data_handler.db.models.zklend_events import (
+    AccumulatorsSyncEventModel,
+    BorrowingEventModel,
+    CollateralEnabledDisabledEventModel,
+    DepositEventModel,
+    LiquidationEventModel,
+    RepaymentEventModel,
+    WithdrawalEventModel,
+)
 from data_handler.handler_tools.data_parser.zklend import ZklendDataParser
 
 from data_handler.handler_tools.data_parser.serializers import (
-    AccumulatorsSyncEventData,
     LiquidationEventData,
     WithdrawalEventData,
     BorrowingEventData,
@@ -41,6 +52,7 @@ def transformer():
         
         return transformer
 
+
 @pytest.fixture(scope="function")
 def sample_borrowing_event_data() -> Dict[str, Any]:
     """
@@ -136,7 +148,6 @@ def sample_withdrawal_event_data() -> Dict[str, Any]:
     }
 
 
-
 @pytest.fixture(scope="function")
 def sample_collateral_enabled_event_data() -> Dict[str, Any]:
     """
@@ -205,68 +216,68 @@ def test_save_borrowing_event(transformer, sample_borrowing_event_data):
     Test saving a borrowing event.
     """
     # Setup API response
-    transformer.api_connector.get_data.return_value = [sample_borrowing_event_data]
+    transformer.api_connector.stream_data.return_value = [sample_borrowing_event_data]
 
     expected_parsed_data = BorrowingEventData(
         user=sample_borrowing_event_data['data'][0],
         token=sample_borrowing_event_data['data'][1],
-        raw_amount=sample_borrowing_event_data['data'][2],
-        face_amount=sample_borrowing_event_data['data'][3]
+        raw_amount=Decimal(int(sample_borrowing_event_data['data'][2], 16)),
+        face_amount=Decimal(int(sample_borrowing_event_data['data'][3], 16))
     )
 
     # Call the method
     transformer.fetch_and_transform_events(
         from_address=transformer.PROTOCOL_ADDRESSES,
         min_block=0,
-        max_block=1000
+        max_block=999
     )
 
     # Verify DB connector was called with correct data
-    transformer.db_connector.create_borrowing_event.assert_called_once_with(
-        protocol_id=ProtocolIDs.ZKLEND,
-        event_name=sample_borrowing_event_data['key_name'],
-        block_number=sample_borrowing_event_data['block_number'],
-        event_data={
+    transformer.db_connector.write_events.assert_called_once_with({
+        BorrowingEventModel: [{
+            'protocol_id': ProtocolIDs.ZKLEND,
+            'event_name': sample_borrowing_event_data['key_name'],
+            'block_number': sample_borrowing_event_data['block_number'],
             'user': expected_parsed_data.user,
             'token': expected_parsed_data.token,
             'raw_amount': expected_parsed_data.raw_amount,
-            'face_amount': expected_parsed_data.face_amount
-        }
-    )
+            'face_amount': expected_parsed_data.face_amount,
+        }]
+    })
 
 
 def test_save_repayment_event(transformer, sample_repayment_event_data):
     """
     Test saving a repayment event.
     """
-    transformer.api_connector.get_data.return_value = [sample_repayment_event_data]
+    transformer.api_connector.stream_data.return_value = [sample_repayment_event_data]
 
     expected_parsed_data = RepaymentEventData(
         repayer=sample_repayment_event_data['data'][0],
         beneficiary=sample_repayment_event_data['data'][1],
         token=sample_repayment_event_data['data'][2],
-        raw_amount=sample_repayment_event_data['data'][3],
-        face_amount=sample_repayment_event_data['data'][4]
+        raw_amount=Decimal(int(sample_repayment_event_data['data'][3], 16)),
+        face_amount=Decimal(int(sample_repayment_event_data['data'][4], 16))
     )
 
     transformer.fetch_and_transform_events(
         from_address=transformer.PROTOCOL_ADDRESSES,
         min_block=0,
-        max_block=1000
+        max_block=999
     )
 
-    transformer.db_connector.create_repayment_event.assert_called_once_with(
-        protocol_id=ProtocolIDs.ZKLEND,
-        event_name=sample_repayment_event_data['key_name'],
-        block_number=sample_repayment_event_data['block_number'],
-        event_data={
+    transformer.db_connector.write_events.assert_called_once_with({
+        RepaymentEventModel: [{
+            'protocol_id': ProtocolIDs.ZKLEND,
+            'event_name': sample_repayment_event_data['key_name'],
+            'block_number': sample_repayment_event_data['block_number'],
             'repayer': expected_parsed_data.repayer,
             'beneficiary': expected_parsed_data.beneficiary,
             'token': expected_parsed_data.token,
             'raw_amount': expected_parsed_data.raw_amount,
-            'face_amount': expected_parsed_data.face_amount
-        }
-    )
+            'face_amount': expected_parsed_data.face_amount,
+        }]
+    })
 
 
 def test_unsupported_event_type(transformer):
@@ -278,36 +289,46 @@ def test_unsupported_event_type(transformer):
         'data': [],
         'block_number': 1000
     }
-    transformer.api_connector.get_data.return_value = [unsupported_event]
+    transformer.api_connector.stream_data.return_value = [unsupported_event]
 
     # Should not raise an exception
     transformer.fetch_and_transform_events(
         from_address=transformer.PROTOCOL_ADDRESSES,
         min_block=0,
-        max_block=1000
+        max_block=999
     )
 
     # Verify no DB calls were made
-    transformer.db_connector.create_borrowing_event.assert_not_called()
-    transformer.db_connector.create_repayment_event.assert_not_called()
-    transformer.db_connector.create_deposit_event.assert_not_called()
-    transformer.db_connector.create_withdrawal_event.assert_not_called()
-    transformer.db_connector.create_collateral_enabled_event.assert_not_called()
-    transformer.db_connector.create_collateral_disabled_event.assert_not_called()
-    transformer.db_connector.create_accumulators_sync_event.assert_not_called()
+    transformer.db_connector.write_events.assert_not_called()
 
 
 def test_api_error_handling(transformer):
     """
     Test handling of API errors.
     """
-    transformer.api_connector.get_data.return_value = {'error': 'API Error'}
+    transformer.api_connector.stream_data.side_effect = RequestException('API Error')
 
     with pytest.raises(ValueError, match='Error fetching events: API Error'):
         transformer.fetch_and_transform_events(
             from_address=transformer.PROTOCOL_ADDRESSES,
             min_block=0,
-            max_block=1000
+            max_block=999
+        )
+
+
+def test_api_malformed_response_handling(transformer):
+    """
+    Test handling of a response body that is not valid JSON.
+    """
+    transformer.api_connector.stream_data.side_effect = ijson.IncompleteJSONError(
+        'premature EOF'
+    )
+
+    with pytest.raises(ValueError, match='Error fetching events: premature EOF'):
+        transformer.fetch_and_transform_events(
+            from_address=transformer.PROTOCOL_ADDRESSES,
+            min_block=0,
+            max_block=999
         )
 
 
@@ -315,67 +336,67 @@ def test_save_deposit_event(transformer, sample_deposit_event_data):
     """
     Test saving a deposit event.
     """
-    transformer.api_connector.get_data.return_value = [sample_deposit_event_data]
+    transformer.api_connector.stream_data.return_value = [sample_deposit_event_data]
 
     expected_parsed_data = DepositEventData(
         user=sample_deposit_event_data['data'][0],
         token=sample_deposit_event_data['data'][1],
-        face_amount=sample_deposit_event_data['data'][2]
+        face_amount=Decimal(int(sample_deposit_event_data['data'][2], 16))
     )
 
     transformer.fetch_and_transform_events(
         from_address=transformer.PROTOCOL_ADDRESSES,
         min_block=0,
-        max_block=1000
+        max_block=999
     )
 
-    transformer.db_connector.create_deposit_event.assert_called_once_with(
-        protocol_id=ProtocolIDs.ZKLEND,
-        event_name=sample_deposit_event_data['key_name'],
-        block_number=sample_deposit_event_data['block_number'],
-        event_data={
+    transformer.db_connector.write_events.assert_called_once_with({
+        DepositEventModel: [{
+            'protocol_id': ProtocolIDs.ZKLEND,
+            'event_name': sample_deposit_event_data['key_name'],
+            'block_number': sample_deposit_event_data['block_number'],
             'user': expected_parsed_data.user,
             'token': expected_parsed_data.token,
-            'face_amount': expected_parsed_data.face_amount
-        }
-    )
+            'face_amount': expected_parsed_data.face_amount,
+        }]
+    })
 
 
 def test_save_withdrawal_event(transformer, sample_withdrawal_event_data):
     """
     Test saving a withdrawal event.
     """
-    transformer.api_connector.get_data.return_value = [sample_withdrawal_event_data]
+    transformer.api_connector.stream_data.return_value = [sample_withdrawal_event_data]
 
     expected_parsed_data = WithdrawalEventData(
         user=sample_withdrawal_event_data['data'][0],
         token=sample_withdrawal_event_data['data'][2],
-        amount=sample_withdrawal_event_data['data'][1]
+        amount=Decimal(int(sample_withdrawal_event_data['data'][1], 16))
     )
 
     transformer.fetch_and_transform_events(
         from_address=transformer.PROTOCOL_ADDRESSES,
         min_block=0,
-        max_block=1000
+        max_block=999
     )
 
-    transformer.db_connector.create_withdrawal_event.assert_called_once_with(
-        protocol_id=ProtocolIDs.ZKLEND,
-        event_name=sample_withdrawal_event_data['key_name'],
-        block_number=sample_withdrawal_event_data['block_number'],
-        event_data={
+    transformer.db_connector.write_events.assert_called_once_with({
+        WithdrawalEventModel: [{
+            'protocol_id': ProtocolIDs.ZKLEND,
+            'event_name': sample_withdrawal_event_data['key_name'],
+            'block_number': sample_withdrawal_event_data['block_number'],
             'user': expected_parsed_data.user,
             'token': expected_parsed_data.token,
-            'amount': expected_parsed_data.amount
-        }
-    )
+            'amount': expected_parsed_data.amount,
+        }]
+    })
 
 
 def test_save_collateral_enabled_event(transformer, sample_collateral_enabled_event_data):
     """
     Test saving a collateral enabled event.
     """
-    transformer.api_connector.get_data.return_value = [sample_collateral_enabled_event_data]
+    transformer.api_connector.stream_data.return_value = [sample_collateral_enabled_event_data]
     expected_parsed_data = CollateralEnabledDisabledEventData(
         user=sample_collateral_enabled_event_data['data'][0],
         token=sample_collateral_enabled_event_data['data'][1],
@@ -384,25 +405,25 @@ def test_save_collateral_enabled_event(transformer, sample_collateral_enabled_ev
     transformer.fetch_and_transform_events(
         from_address=transformer.PROTOCOL_ADDRESSES,
         min_block=0,
-        max_block=1000
+        max_block=999
     )
 
-    transformer.db_connector.create_collateral_enabled_disabled_event.assert_called_once_with(
-        protocol_id=ProtocolIDs.ZKLEND,
-        event_name=sample_collateral_enabled_event_data['key_name'],
-        block_number=sample_collateral_enabled_event_data['block_number'],
-        event_data={
+    transformer.db_connector.write_events.assert_called_once_with({
+        CollateralEnabledDisabledEventModel: [{
+            'protocol_id': ProtocolIDs.ZKLEND,
+            'event_name': sample_collateral_enabled_event_data['key_name'],
+            'block_number': sample_collateral_enabled_event_data['block_number'],
             'user': expected_parsed_data.user,
-            'token': expected_parsed_data.token
-        }
-    )
+            'token': expected_parsed_data.token,
+        }]
+    })
 
 
 def test_save_collateral_disabled_event(transformer, sample_collateral_disabled_event_data):
     """
     Test saving a collateral disabled event.
     """
-    transformer.api_connector.get_data.return_value = [sample_collateral_disabled_event_data]
+    transformer.api_connector.stream_data.return_value = [sample_collateral_disabled_event_data]
 
     expected_parsed_data = CollateralEnabledDisabledEventData(
         user=sample_collateral_disabled_event_data['data'][0],
@@ -412,44 +433,278 @@ def test_save_collateral_disabled_event(transformer, sample_collateral_disabled_
     transformer.fetch_and_transform_events(
         from_address=transformer.PROTOCOL_ADDRESSES,
         min_block=0,
-        max_block=1000
+        max_block=999
     )
 
-    transformer.db_connector.create_collateral_enabled_disabled_event.assert_called_once_with(
-        protocol_id=ProtocolIDs.ZKLEND,
-        event_name=sample_collateral_disabled_event_data['key_name'],
-        block_number=sample_collateral_disabled_event_data['block_number'],
-        event_data={
+    transformer.db_connector.write_events.assert_called_once_with({
+        CollateralEnabledDisabledEventModel: [{
+            'protocol_id': ProtocolIDs.ZKLEND,
+            'event_name': sample_collateral_disabled_event_data['key_name'],
+            'block_number': sample_collateral_disabled_event_data['block_number'],
             'user': expected_parsed_data.user,
-            'token': expected_parsed_data.token
-        }
+            'token': expected_parsed_data.token,
+        }]
+    })
+
+
+def test_written_rows_have_addresses_and_decimal_amounts(
+    transformer, sample_withdrawal_event_data
+):
+    """
+    Test that validated events are written with padded addresses and Decimal amounts.
+    """
+    liquidation_event_data = {
+        "block_number": 630050,
+        "key_name": "zklend::market::Market::Liquidation",
+        "data": [
+            "0x5fe6b7feb2d2cc1fc78eb1d1d7ea1ddd24c2eaf7ef3ac6bd1c7a16d39d3b09d",
+            "0x4e14a3f3f8fc3bc2d2ee5d9c5ba3a4ed8e46e3ee7b9a4f0a1b3b3d5ddc3c1a2",
+            "0x53c91253bc9682c04929ca02ed00b3e423f6710d2ee7e0d5ebb06f3ecf368a8",
+            "0x1a055690d9db80000",
+            "0x18b4f5e2c3d1a0000",
+            "0x49d36570d4e46f48e99674bd3fcc84644ddd6b96f7c741b1562b82f9e004dc7",
+            "0x2c68af0bb140000",
+        ],
+    }
+    transformer.api_connector.stream_data.return_value = [
+        sample_withdrawal_event_data, liquidation_event_data
+    ]
+
+    transformer.fetch_and_transform_events(
+        from_address=transformer.PROTOCOL_ADDRESSES,
+        min_block=0,
+        max_block=999
     )
 
+    written = transformer.db_connector.write_events.call_args.args[0]
+    withdrawal, = written[WithdrawalEventModel]
+    liquidation, = written[LiquidationEventModel]
+    for row, address_fields, amount_fields in (
+        (withdrawal, ('user', 'token'), ('amount',)),
+        (
+            liquidation,
+            ('liquidator', 'user', 'debt_token', 'collateral_token'),
+            ('debt_raw_amount', 'debt_face_amount', 'collateral_amount'),
+        ),
+    ):
+        for field in address_fields:
+            assert row[field] is not None
+            assert len(row[field]) == 66
+        for field in amount_fields:
+            assert isinstance(row[field], Decimal)
+    assert liquidation['collateral_amount'] == Decimal(200000000000000000)
+
+
 def test_save_accumulators_sync_event(transformer, sample_accumulators_sync_event_data):
     """
     Test saving an accumulators sync event.
     """
-    transformer.api_connector.get_data.return_value = [sample_accumulators_sync_event_data]
+    transformer.api_connector.stream_data.return_value = [sample_accumulators_sync_event_data]
+
+    transformer.fetch_and_transform_events(
+        from_address=transformer.PROTOCOL_ADDRESSES,
+        min_block=0,
+        max_block=999
+    )
+
+    transformer.db_connector.write_events.assert_called_once_with({
+        AccumulatorsSyncEventModel: [{
+            'protocol_id': ProtocolIDs.ZKLEND,
+            'event_name': sample_accumulators_sync_event_data['key_name'],
+            'block_number': sample_accumulators_sync_event_data['block_number'],
+            'token': '0x053c91253bc9682c04929ca02ed00b3e423f6710d2ee7e0d5ebb06f3ecf368a8',
+            'lending_accumulator': Decimal('1.035072630634528682856512366'),
+            'debt_accumulator': Decimal('1.050265551927467103297444554'),
+        }]
+    })
+
+
+def test_accumulators_sync_parsers_agree(sample_accumulators_sync_event_data):
+    """
+    Test that the single-event and batch AccumulatorsSync parsers give the same result.
+    """
+    data = sample_accumulators_sync_event_data['data']
+
+    parsed_event = ZklendDataParser.parse_accumulators_sync_event(data)
+
+    assert ZklendDataParser.parse_accumulators_sync_batch([data]) == [vars(parsed_event)]
+
+
+def test_accumulators_sync_batch_rejects_invalid_token(sample_accumulators_sync_event_data):
+    """
+    Test that the batch AccumulatorsSync parser rejects tokens like the serializer does.
+    """
+    data = sample_accumulators_sync_event_data['data']
+    invalid_data = [data[0][2:], *data[1:]]
+
+    with pytest.raises(ValueError, match='Invalid address provided for token'):
+        ZklendDataParser.parse_accumulators_sync_event(invalid_data)
+    with pytest.raises(ValueError, match='Invalid address provided for token'):
+        ZklendDataParser.parse_accumulators_sync_batch([data, invalid_data])
+
+
+def test_events_are_grouped_by_model(
+    transformer, sample_deposit_event_data, sample_withdrawal_event_data
+):
+    """
+    Test that events of the same type are written in a single batch.
+    """
+    transformer.api_connector.stream_data.return_value = [
+        sample_deposit_event_data,
+        sample_withdrawal_event_data,
+        sample_deposit_event_data,
+    ]
+
+    transformer.fetch_and_transform_events(
+        from_address=transformer.PROTOCOL_ADDRESSES,
+        min_block=0,
+        max_block=999
+    )
+
+    transformer.db_connector.write_events.assert_called_once()
+    written = transformer.db_connector.write_events.call_args.args[0]
+    assert written.keys() == {DepositEventModel, WithdrawalEventModel}
+    assert len(written[DepositEventModel]) == 2
+    assert len(written[WithdrawalEventModel]) == 1
+
+
+def test_run_fetches_consecutive_pages(transformer, sample_deposit_event_data):
+    """
+    Test that run streams consecutive block ranges and writes every page.
+    """
+    transformer.api_connector.stream_data.side_effect = (
+        lambda **kwargs: iter([sample_deposit_event_data])
+    )
+
+    transformer.run()
+
+    fetched_ranges = [
+        (call.kwargs['min_block_number'], call.kwargs['max_block_number'])
+        for call in transformer.api_connector.stream_data.call_args_list
+    ]
+    assert fetched_ranges == [(i * 1000, i * 1000 + 999) for i in range(5)]
+    assert transformer.db_connector.write_events.call_count == 5
+    assert transformer.last_block == 5 * transformer.PAGINATION_SIZE
+
+
+def test_run_writes_each_page_in_one_transaction(transformer, sample_deposit_event_data):
+    """
+    Test that run writes a page larger than WRITE_BATCH_SIZE in a single call.
+    """
+    transformer.WRITE_BATCH_SIZE = 2
+    transformer.api_connector.stream_data.side_effect = (
+        lambda **kwargs: iter([sample_deposit_event_data] * 5)
+    )
+
+    transformer.run()
+
+    batch_sizes = [
+        len(call.args[0][DepositEventModel])
+        for call in transformer.db_connector.write_events.call_args_list
+    ]
+    assert batch_sizes == [5] * 5
+
+
+def test_large_block_range_is_fetched_in_chunks(transformer, sample_deposit_event_data):
+    """
+    Test that a block range wider than CHUNK_BLOCKS is split into sub-ranges.
+    """
+    transformer.api_connector.get_data.return_value = [sample_deposit_event_data]
 
-    expected_parsed_data = AccumulatorsSyncEventData(
-        token=sample_accumulators_sync_event_data['data'][0],
-        lending_accumulator=sample_accumulators_sync_event_data['data'][1],
-        debt_accumulator=sample_accumulators_sync_event_data['data'][2]
+    transformer.fetch_and_transform_events(
+        from_address=transformer.PROTOCOL_ADDRESSES,
+        min_block=0,
+        max_block=2500
     )
 
+    fetched_ranges = sorted(
+        (call.kwargs['min_block_number'], call.kwargs['max_block_number'])
+        for call in transformer.api_connector.get_data.call_args_list
+    )
+    assert fetched_ranges == [(0, 999), (1000, 1999), (2000, 2500)]
+    written = transformer.db_connector.write_events.call_args.args[0]
+    assert len(written[DepositEventModel]) == 3
+
+
+def test_range_one_block_wider_than_a_chunk_is_split(transformer, sample_deposit_event_data):
+    """
+    Test that a range of CHUNK_BLOCKS + 1 blocks is not fetched as a single chunk.
+    """
+    transformer.api_connector.get_data.return_value = [sample_deposit_event_data]
+
     transformer.fetch_and_transform_events(
         from_address=transformer.PROTOCOL_ADDRESSES,
         min_block=0,
         max_block=1000
     )
 
-    transformer.db_connector.create_accumulator_event.assert_called_once_with(
-        protocol_id=ProtocolIDs.ZKLEND,
-        event_name=sample_accumulators_sync_event_data['key_name'],
-        block_number=sample_accumulators_sync_event_data['block_number'],
-        event_data={
-            'token': expected_parsed_data.token,
-            'lending_accumulator': expected_parsed_data.lending_accumulator,
-            'debt_accumulator': expected_parsed_data.debt_accumulator
-        }
+    transformer.api_connector.stream_data.assert_not_called()
+    fetched_ranges = sorted(
+        (call.kwargs['min_block_number'], call.kwargs['max_block_number'])
+        for call in transformer.api_connector.get_data.call_args_list
     )
+    assert fetched_ranges == [(0, 999), (1000, 1000)]
+
+
+def test_chunked_range_boundary_blocks_are_not_duplicated(
+    transformer, sample_deposit_event_data
+):
+    """
+    Test that events on chunk boundary blocks are fetched and written once.
+    """
+    block_numbers = [0, 999, 1000, 1999, 2000, 2500]
+
+    def get_data(from_address, min_block_number, max_block_number):
+        # The API bounds are inclusive
+        return [
+            {**sample_deposit_event_data, 'block_number': block_number}
+            for block_number in block_numbers
+            if min_block_number <= block_number <= max_block_number
+        ]
+
+    transformer.api_connector.get_data.side_effect = get_data
+
+    transformer.fetch_and_transform_events(
+        from_address=transformer.PROTOCOL_ADDRESSES,
+        min_block=0,
+        max_block=2500
+    )
+
+    written = transformer.db_connector.write_events.call_args.args[0]
+    assert sorted(row['block_number'] for row in written[DepositEventModel]) == block_numbers
+
+
+def test_api_error_handling_for_chunked_range(transformer):
+    """
+    Test handling of API errors when a wide range is fetched in chunks.
+    """
+    transformer.api_connector.get_data.return_value = {'error': 'API Error'}
+
+    with pytest.raises(ValueError, match='Error fetching events: API Error'):
+        transformer.fetch_and_transform_events(
+            from_address=transformer.PROTOCOL_ADDRESSES,
+            min_block=0,
+            max_block=2500
+        )
+
+
+def test_streamed_events_are_written_in_batches(transformer, sample_deposit_event_data):
+    """
+    Test that streamed events are written once per WRITE_BATCH_SIZE events.
+    """
+    transformer.WRITE_BATCH_SIZE = 2
+    transformer.api_connector.stream_data.return_value = iter(
+        [sample_deposit_event_data] * 5
+    )
+
+    transformer.fetch_and_transform_events(
+        from_address=transformer.PROTOCOL_ADDRESSES,
+        min_block=0,
+        max_block=999
+    )
+
+    batch_sizes = [
+        len(call.args[0][DepositEventModel])
+        for call in transformer.db_connector.write_events.call_args_list
+    ]
+    assert batch_sizes == [2, 2, 1]
@@ -1,9 +1,10 @@
+from datetime import datetime
 from typing import Type, TypeVar
 from uuid import UUID
 
 from database.database import SQLALCHEMY_DATABASE_URL
-from database.models import Base
-from sqlalchemy import create_engine, func
+from database.models import Base, NotificationData, TelegramLog
+from sqlalchemy import create_engine, exists, func
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, scoped_session, sessionmaker
 from utils.values import (
@@ -146,6 +147,34 @@ class DBConnector:
         finally:
             db.close()
 
+    def get_new_notification_object(
+        self, notification_id: UUID = None, queued_at: datetime = None
+    ) -> NotificationData | None:
+        """
+        Retrieves a notification unless it was successfully sent after it was queued,
+        in a single query.
+        :param notification_id: UUID = None
+        :param queued_at: datetime = None
+        :return: NotificationData | None
+        """
+        db = self.Session()
+        try:
+            return (
+                db.query(NotificationData)
+                .filter(
+                    NotificationData.id == notification_id,
+                    ~exists().where(
+                        TelegramLog.notification_data_id == notification_id,
+                        # The bare column matches the partial index predicate
+                        TelegramLog.is_succesfully,
+                        TelegramLog.sent_at >= queued_at,
+                    ),
+                )
+                .first()
+            )
+        finally:
+            db.close()
+
     def get_all_activated_subscribers(
         self, model: Type[Base] = None
     ) -> ModelType | None:
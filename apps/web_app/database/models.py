@@ -8,8 +8,10 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
-    MetaData,
+    Index,
     String,
+    func,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped
 from sqlalchemy_utils import IPAddressType
@@ -25,13 +27,12 @@ class Base(DeclarativeBase):
     """
 
     id: Mapped[UUID] = Column(UUID, default=uuid4, primary_key=True)
-    metadata = MetaData()
 
 
 class NotificationData(Base):
     __tablename__ = "notification"
 
-    created_at = Column(DateTime, default=datetime.now())
+    created_at = Column(DateTime, default=datetime.now, server_default=func.now())
     email = Column(String, index=True, nullable=True)
     wallet_id = Column(String, nullable=False)
     telegram_id = Column(String, unique=False, nullable=False)
@@ -51,8 +52,19 @@ class TelegramLog(Base):
     """
 
     __tablename__ = "telegram_log"
+    __table_args__ = (
+        # Partial index: only successful sends are looked up by notification
+        Index(
+            "ix_telegram_log_notification_data_id_is_succesfully",
+            "notification_data_id",
+            "is_succesfully",
+            postgresql_where=text("is_succesfully"),
+        ),
+    )
 
-    sent_at = Column(DateTime, default=datetime.now(), nullable=False)
+    sent_at = Column(
+        DateTime, default=datetime.now, server_default=func.now(), nullable=False
+    )
     notification_data_id = Column(ForeignKey(NotificationData.id), nullable=False)
     is_succesfully = Column(Boolean, nullable=False)
     message = Column(String, server_default="", default="", nullable=False)
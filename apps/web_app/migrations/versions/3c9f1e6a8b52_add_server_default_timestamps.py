@@ -0,0 +1,51 @@
+"""add server default timestamps
+
+Revision ID: 3c9f1e6a8b52
+Revises: b7e2c4d91a3f
+Create Date: 2026-10-15 10:48:05.271934
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlalchemy_utils
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9f1e6a8b52"
+down_revision: Union[str, None] = "b7e2c4d91a3f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "notification",
+        "created_at",
+        existing_type=sa.DateTime(),
+        server_default=sa.func.now(),
+    )
+    op.alter_column(
+        "telegram_log",
+        "sent_at",
+        existing_type=sa.DateTime(),
+        existing_nullable=False,
+        server_default=sa.func.now(),
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "telegram_log",
+        "sent_at",
+        existing_type=sa.DateTime(),
+        existing_nullable=False,
+        server_default=None,
+    )
+    op.alter_column(
+        "notification",
+        "created_at",
+        existing_type=sa.DateTime(),
+        server_default=None,
+    )
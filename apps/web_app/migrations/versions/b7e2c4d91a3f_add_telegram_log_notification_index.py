@@ -0,0 +1,36 @@
+"""add telegram log notification index
+
+Revision ID: b7e2c4d91a3f
+Revises: f4baaac5103f
+Create Date: 2026-10-15 10:12:41.503217
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import sqlalchemy_utils
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e2c4d91a3f"
+down_revision: Union[str, None] = "f4baaac5103f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_telegram_log_notification_data_id_is_succesfully",
+        "telegram_log",
+        ["notification_data_id", "is_succesfully"],
+        unique=False,
+        postgresql_where=sa.text("is_succesfully"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_telegram_log_notification_data_id_is_succesfully",
+        table_name="telegram_log",
+    )
@@ -1,26 +1,36 @@
+from functools import lru_cache
+from itertools import islice
 from typing import Sequence
 from uuid import UUID
 
 from database.crud import ModelType
 from database.models import Base, NotificationData
-from sqlalchemy import delete, select, update
+from sqlalchemy import Row, delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from telegram.config import DATABASE_URL
 
 
+@lru_cache(maxsize=1)
 def get_async_engine() -> AsyncEngine:
     """
-    Get an asynchronous SQLAlchemy engine instance using the configured DATABASE_URL.
+    Get the shared asynchronous SQLAlchemy engine using the configured DATABASE_URL.
+    The engine (and its connection pool) is created once and reused by every caller.
 
     Returns:
        AsyncEngine: An asynchronous SQLAlchemy engine instance.
     """
-    return create_async_engine(DATABASE_URL)
+    return create_async_engine(
+        DATABASE_URL,
+        pool_size=20,
+        max_overflow=10,
+        pool_pre_ping=True,
+    )
 
 
+@lru_cache(maxsize=1)
 def get_async_sessionmaker(engine: AsyncEngine = None) -> async_sessionmaker:
     """
-    Get an asynchronous SQLAlchemy session maker instance.
+    Get an asynchronous SQLAlchemy session maker instance, cached per engine.
 
     Args:
         engine (AsyncEngine, optional): An asynchronous SQLAlchemy engine instance.
@@ -43,6 +53,36 @@ class TelegramCrud:
         """
         self.Session = sessionmaker
 
+    async def create_objects(self, objs: list[Base], batch_size: int = 1000) -> list[UUID]:
+        """
+        Create many objects of the same model in a single transaction.
+
+        Rows are sent as batched INSERT ... RETURNING statements of `batch_size` rows,
+        instead of one INSERT and commit per object.
+
+        Args:
+            objs (list[Base]): Instances of a single SQLAlchemy model class to be created.
+            batch_size (int, optional): The maximum number of rows per INSERT statement.
+
+        Returns:
+            list[UUID]: The IDs of the created objects, in the order they were given.
+        """
+        if not objs:
+            return []
+        model = type(objs[0])
+        stmp = insert(model).returning(model.id, sort_by_parameter_order=True)
+        rows = iter(
+            {key: value for key, value in vars(obj).items() if not key.startswith("_")}
+            for obj in objs
+        )
+        ids = []
+        async with self.Session() as db:
+            while batch := list(islice(rows, batch_size)):
+                result = await db.execute(stmp, batch)
+                ids.extend(result.scalars().all())
+            await db.commit()
+        return ids
+
     async def delete_object(
         self, model: type[Base] = None, obj_id: UUID | str = None
     ) -> None:
@@ -54,7 +94,11 @@ class TelegramCrud:
             obj_id (UUID | str, optional): The ID of the object to be deleted.
         """
         async with self.Session() as db:
-            stmp = delete(NotificationData).where(NotificationData.id == obj_id)
+            stmp = (
+                delete(model)
+                .where(model.id == obj_id)
+                .execution_options(synchronize_session=False)
+            )
             await db.execute(stmp)
             await db.commit()
 
@@ -67,7 +111,11 @@ class TelegramCrud:
             **filters: Key-value pairs representing the filter conditions.
         """
         async with self.Session() as db:
-            stmp = delete(NotificationData).filter_by(**filters)
+            stmp = (
+                delete(model)
+                .filter_by(**filters)
+                .execution_options(synchronize_session=False)
+            )
             await db.execute(stmp)
             await db.commit()
 
@@ -88,8 +136,15 @@ class TelegramCrud:
             await db.commit()
 
     async def get_objects_by_filter(
-        self, model: type[ModelType], offset: int, limit: int, /, **filters
-    ) -> Sequence[ModelType] | ModelType | None:
+        self,
+        model: type[ModelType],
+        offset: int,
+        limit: int,
+        /,
+        *,
+        readonly: bool = False,
+        **filters,
+    ) -> Sequence[ModelType | Row] | ModelType | Row | None:
         """
         Get objects from the database based on a filter, with offset and limit.
 
@@ -97,14 +152,23 @@ class TelegramCrud:
             model (type[ModelType]): The SQLAlchemy model class for the objects to be retrieved.
             offset (int): The offset for the query results.
             limit (int): The maximum number of results to be returned.
+            readonly (bool, optional): If True, select the table columns and return plain
+                `Row` tuples, skipping ORM instance construction and identity-map tracking.
             **filters: Key-value pairs representing the filter conditions.
 
         Returns:
-            Sequence[ModelType] | ModelType | None: A sequence of model instances if `limit` is greater than 1,
-                a single model instance if `limit` is 1, or None if no objects match the filter.
+            Sequence[ModelType | Row] | ModelType | Row | None: A sequence of model instances
+                (or rows if `readonly`) if `limit` is greater than 1, a single one if `limit`
+                is 1, or None if no objects match the filter.
         """
         async with self.Session() as db:
+            if readonly:
+                stmp = select(*model.__table__.c).filter_by(**filters)
+                stmp = stmp.offset(offset).limit(limit)
+                result = await db.execute(stmp)
+                return result.first() if limit == 1 else result.all()
+
             stmp = select(model).filter_by(**filters).offset(offset).limit(limit)
             if limit == 1:
                 return await db.scalar(stmp)
-            return await db.scalars(stmp).all()
+            return (await db.scalars(stmp)).all()
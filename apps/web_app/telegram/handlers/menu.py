@@ -63,7 +63,11 @@ async def show_notifications(callback: types.CallbackQuery, crud: TelegramCrud):
         page = int(callback.data.removeprefix("notifications_"))
     # get the current page of notifications
     obj = await crud.get_objects_by_filter(
-        NotificationData, page, 1, telegram_id=str(callback.from_user.id)
+        NotificationData,
+        page,
+        1,
+        readonly=True,
+        telegram_id=str(callback.from_user.id),
     )
     # handle callback answer (from pagination)
     if not obj and callback.data.startswith("notifications_"):
@@ -1,12 +1,13 @@
 import asyncio
 from asyncio.queues import Queue, QueueFull
 from contextlib import suppress
+from datetime import datetime
 from uuid import UUID
 
 from aiogram import exceptions
 from aiogram.utils.deep_linking import create_deep_link
 from database.crud import DBConnector
-from database.models import NotificationData, TelegramLog
+from database.models import TelegramLog
 
 from .bot import bot
 
@@ -49,11 +50,12 @@ class TelegramNotifications:
     @classmethod
     async def send_notification(cls, notification_id: UUID) -> None:
         """
-        Add a Telegram ID to the queue for sending a notification.
+        Add a Telegram ID to the queue for sending a notification, together with the time
+        it was queued.
 
         :param notification_id: Unique identifier of the NotificationData.id, which will be added to the queue for sending via Telegram.
         """
-        await cls.__queue_to_send.put(notification_id)
+        await cls.__queue_to_send.put((notification_id, datetime.now()))
 
     async def log_send(self, notification_id: UUID, text: str, is_succesfully: bool):
         """
@@ -98,13 +100,15 @@ class TelegramNotifications:
                    This parameter is effective only when is_infinity is set to True.
                    Defaults to 0.05 seconds.
         """
-        while notification_id := await self.__queue_to_send.get():
-            # Retrieve notification data from the database based on its ID
-            notification = self.db_connector.get_object(
-                NotificationData, notification_id
+        while queued_notification := await self.__queue_to_send.get():
+            notification_id, queued_at = queued_notification
+            # Retrieve notification data, unless it was already delivered since it was
+            # queued, e.g. by another copy of a send that is being retried
+            notification = self.db_connector.get_new_notification_object(
+                notification_id, queued_at
             )
             if notification is None:
-                continue  # skip is not valid notification_id
+                continue  # skip invalid or already delivered notification_id
             is_succesfully = False
             # create text message
             text = self.text.format(wallet_id=notification.wallet_id)
@@ -122,7 +126,7 @@ class TelegramNotifications:
                 await asyncio.sleep(e.retry_after)
                 # Ignore QueueFull exception to prevent it from being raised when the queue is explicitly limited
                 with suppress(QueueFull):
-                    self.__queue_to_send.put_nowait(notification_id)
+                    self.__queue_to_send.put_nowait(queued_notification)
             except exceptions.TelegramAPIError:
                 pass  # skip errors
 
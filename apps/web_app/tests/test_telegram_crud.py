@@ -0,0 +1,154 @@
+import asyncio
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+from database.crud import DBConnector
+from database.models import NotificationData, TelegramLog
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from telegram.config import DATABASE_URL
+from telegram.crud import TelegramCrud
+from utils.values import ProtocolIDs
+
+_TELEGRAM_ID = "456"
+
+
+def _notification(wallet_id: str, **values) -> NotificationData:
+    """
+    Creates a notification for the test user
+    :return: NotificationData
+    """
+    return NotificationData(
+        wallet_id=wallet_id,
+        telegram_id=_TELEGRAM_ID,
+        ip_address="127.0.0.1",
+        health_ratio_level=1.5,
+        protocol_id=ProtocolIDs.ZKLEND,
+        **values,
+    )
+
+
+@pytest.fixture
+def db_connector() -> DBConnector:
+    """
+    Creates a DBConnector for the test database and removes the test notifications afterwards
+    :return: DBConnector
+    """
+    db_connector = DBConnector()
+    yield db_connector
+
+    db = db_connector.Session()
+    try:
+        notifications = db.query(NotificationData).filter(
+            NotificationData.telegram_id == _TELEGRAM_ID
+        )
+        db.query(TelegramLog).filter(
+            TelegramLog.notification_data_id.in_(
+                notifications.with_entities(NotificationData.id).scalar_subquery()
+            )
+        ).delete(synchronize_session=False)
+        notifications.delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def crud() -> TelegramCrud:
+    """
+    Creates a TelegramCrud for the test database
+    :return: TelegramCrud
+    """
+    # Every test runs its own event loop, so connections must not be pooled between them
+    engine = create_async_engine(DATABASE_URL, poolclass=NullPool)
+    return TelegramCrud(async_sessionmaker(engine))
+
+
+class TestTelegramCrud:
+    def test_create_objects(self, crud, db_connector):
+        # Setup
+        objs = [
+            _notification("0x01"),
+            _notification("0x02", email="user@example.com"),
+            _notification("0x03"),
+        ]
+
+        # Execute
+        created_after = datetime.now()
+        ids = asyncio.run(crud.create_objects(objs, batch_size=2))
+        created_before = datetime.now()
+
+        # Verify
+        assert all(isinstance(obj_id, UUID) for obj_id in ids)
+        assert len(set(ids)) == 3
+        created = [db_connector.get_object(NotificationData, obj_id) for obj_id in ids]
+        assert [obj.wallet_id for obj in created] == ["0x01", "0x02", "0x03"]
+        assert [obj.email for obj in created] == [None, "user@example.com", None]
+        assert all(created_after <= obj.created_at <= created_before for obj in created)
+
+    def test_get_objects_by_filter_readonly(self, crud, db_connector):
+        # Setup
+        obj_id = db_connector.write_to_db(_notification("0x01"))
+        db_connector.write_to_db(_notification("0x02"))
+
+        # Execute
+        obj = asyncio.run(
+            crud.get_objects_by_filter(
+                NotificationData, 0, 1, readonly=True, id=obj_id
+            )
+        )
+        objs = asyncio.run(
+            crud.get_objects_by_filter(
+                NotificationData, 0, 10, readonly=True, telegram_id=_TELEGRAM_ID
+            )
+        )
+
+        # Verify
+        assert isinstance(obj, Row)
+        # The attributes the notification menu reads from the page row
+        assert obj.id == obj_id
+        assert obj.wallet_id == "0x01"
+        assert obj.health_ratio_level == 1.5
+        assert obj.protocol_id.name == ProtocolIDs.ZKLEND.name
+        assert len(objs) == 2
+        assert all(isinstance(row, Row) for row in objs)
+
+    def test_delete_object(self, crud, db_connector):
+        # Setup
+        notification_id = db_connector.write_to_db(_notification("0x01"))
+        log_id = db_connector.write_to_db(
+            TelegramLog(notification_data_id=notification_id, is_succesfully=True)
+        )
+
+        # Execute
+        asyncio.run(crud.delete_object(TelegramLog, log_id))
+
+        # Verify
+        assert db_connector.get_object(TelegramLog, log_id) is None
+        assert db_connector.get_object(NotificationData, notification_id) is not None
+
+    def test_delete_objects_by_filter(self, crud, db_connector):
+        # Setup
+        notification_id = db_connector.write_to_db(_notification("0x01"))
+        other_notification_id = db_connector.write_to_db(_notification("0x02"))
+        log_ids = [
+            db_connector.write_to_db(
+                TelegramLog(notification_data_id=obj_id, is_succesfully=True)
+            )
+            for obj_id in (notification_id, notification_id, other_notification_id)
+        ]
+
+        # Execute
+        asyncio.run(
+            crud.delete_objects_by_filter(
+                TelegramLog, notification_data_id=notification_id
+            )
+        )
+
+        # Verify
+        assert db_connector.get_object(TelegramLog, log_ids[0]) is None
+        assert db_connector.get_object(TelegramLog, log_ids[1]) is None
+        assert db_connector.get_object(TelegramLog, log_ids[2]) is not None
+        assert db_connector.get_object(NotificationData, notification_id) is not None
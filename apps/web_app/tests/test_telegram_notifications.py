@@ -0,0 +1,142 @@
+import asyncio
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from database.crud import DBConnector
+from database.models import NotificationData, TelegramLog
+from telegram.utils import TelegramNotifications
+from utils.values import ProtocolIDs
+
+_queue_to_send = TelegramNotifications._TelegramNotifications__queue_to_send
+# A skipped notification leaves the loop waiting on the queue, so fail instead of hanging
+_SEND_TIMEOUT = 5
+
+
+@pytest.fixture
+def db_connector() -> DBConnector:
+    """
+    Creates a DBConnector for the test database
+    :return: DBConnector
+    """
+    return DBConnector()
+
+
+@pytest.fixture
+def notification_id(db_connector: DBConnector) -> str:
+    """
+    Creates a notification in the test database and removes it with its logs afterwards
+    :return: str
+    """
+    notification_id = db_connector.write_to_db(
+        NotificationData(
+            wallet_id="0x01",
+            telegram_id="123",
+            ip_address="127.0.0.1",
+            health_ratio_level=1.5,
+            protocol_id=ProtocolIDs.ZKLEND,
+        )
+    )
+    yield notification_id
+
+    db = db_connector.Session()
+    try:
+        db.query(TelegramLog).filter(
+            TelegramLog.notification_data_id == notification_id
+        ).delete()
+        db.query(NotificationData).filter(NotificationData.id == notification_id).delete()
+        db.commit()
+    finally:
+        db.close()
+
+
+class TestTelegramNotifications:
+    @patch("telegram.utils.bot")
+    def test_invalid_notification_is_skipped(self, mock_bot):
+        # Setup
+        mock_bot.send_message = AsyncMock()
+        db_connector = MagicMock()
+        db_connector.get_new_notification_object.return_value = None
+        notifications = TelegramNotifications(db_connector=db_connector)
+        notification_id = uuid4()
+
+        async def send() -> None:
+            await TelegramNotifications.send_notification(notification_id)
+            _queue_to_send.put_nowait(None)  # stops the loop
+            await notifications()
+
+        # Execute
+        asyncio.run(send())
+
+        # Verify
+        db_connector.get_new_notification_object.assert_called_once_with(
+            notification_id, ANY
+        )
+        mock_bot.send_message.assert_not_called()
+        db_connector.write_to_db.assert_not_called()
+
+    @patch("telegram.utils.bot")
+    def test_new_notification_is_sent_and_logged(self, mock_bot):
+        # Setup
+        mock_bot.send_message = AsyncMock()
+        db_connector = MagicMock()
+        notification = db_connector.get_new_notification_object.return_value
+        notification.telegram_id = "123"
+        notifications = TelegramNotifications(db_connector=db_connector, text="{wallet_id}")
+        notification_id = uuid4()
+
+        async def send() -> None:
+            await TelegramNotifications.send_notification(notification_id)
+            await notifications()
+
+        # Execute
+        asyncio.run(send())
+
+        # Verify
+        mock_bot.send_message.assert_called_once_with(
+            chat_id="123", text=str(notification.wallet_id)
+        )
+        log = db_connector.write_to_db.call_args.args[0]
+        assert log.notification_data_id == notification_id
+        assert log.is_succesfully is True
+
+    @patch("telegram.utils.bot")
+    def test_notification_is_sent_again_after_a_successful_send(
+        self, mock_bot, db_connector, notification_id
+    ):
+        # Setup
+        mock_bot.send_message = AsyncMock()
+        notifications = TelegramNotifications(db_connector=db_connector)
+
+        async def send_twice() -> None:
+            await TelegramNotifications.send_notification(notification_id)
+            await asyncio.wait_for(notifications(), timeout=_SEND_TIMEOUT)
+            await TelegramNotifications.send_notification(notification_id)
+            await asyncio.wait_for(notifications(), timeout=_SEND_TIMEOUT)
+
+        # Execute
+        asyncio.run(send_twice())
+
+        # Verify
+        assert mock_bot.send_message.await_count == 2
+
+    @patch("telegram.utils.bot")
+    def test_copy_queued_before_a_successful_send_is_skipped(
+        self, mock_bot, db_connector, notification_id
+    ):
+        # Setup
+        mock_bot.send_message = AsyncMock()
+        notifications = TelegramNotifications(db_connector=db_connector)
+
+        async def send_copies() -> None:
+            await TelegramNotifications.send_notification(notification_id)
+            await TelegramNotifications.send_notification(notification_id)
+            await asyncio.wait_for(notifications(), timeout=_SEND_TIMEOUT)
+            _queue_to_send.put_nowait(None)  # stops the loop
+            await asyncio.wait_for(notifications(), timeout=_SEND_TIMEOUT)
+
+        # Execute
+        asyncio.run(send_copies())
+
+        # Verify
+        assert mock_bot.send_message.await_count == 1